@@ -2,6 +2,7 @@
 param(
     [switch] $SetupWinget,
     [switch] $UpgradeAll,
+    [switch] $IdsFromStdin,
     [Parameter(Position = 0, ValueFromRemainingArguments = $true)]
     [string[]] $Apps
 )
@@ -412,6 +413,15 @@ function Invoke-WingetUpgradeAll {
 # Main
 # =====================================================================
 
+if ($IdsFromStdin.IsPresent) {
+    # App-IDs zeilenweise von stdin lesen (umgeht das Kommandozeilen-Limit bei vielen Apps)
+    $Apps = @(
+        [Console]::In.ReadToEnd() -split "`r?`n" |
+            ForEach-Object { $_.Trim() } |
+            Where-Object { $_ }
+    )
+}
+
 if ($SetupWinget.IsPresent) {
     Write-Host "INFO  - Running in SetupWinget mode."
     Install-WingetDependencies
@@ -12,11 +12,14 @@ Optimiert für viele Apps:
 
 from __future__ import annotations
 
+import functools
+import queue
 import re
 import subprocess
 import sys
 import threading
-import webbrowser
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -26,10 +29,8 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+# Pillow wird erst beim Laden des Logos importiert (siehe _import_pillow)
+Image = None
 
 
 # =============================================================================
@@ -50,6 +51,12 @@ ROW_WIDTH = 760
 ROW_HEIGHT = 90  # kannst du bei Bedarf leicht anpassen
 MID_WIDTH = 820   # feste Breite der mittleren Spalte (App-Liste)
 
+# Verzögerung, bevor nach einer Sucheingabe neu gefiltert wird
+SEARCH_DEBOUNCE_MS = 200
+
+# Mindestabstand (s) zwischen zwei Fortschritts-Updates während der Installation
+UI_MIN_INTERVAL = 0.05
+
 # --- Fluent-ish (Windows 11) Light Palette ---
 BG_WINDOW = "#F3F4F6"
 BG_CARD = "#FFFFFF"
@@ -60,6 +67,29 @@ BG_RIGHT_PANEL = "#EFF4FF"
 TEXT_MUTED = "#6B7280"
 ACCENT = "#3B82F6"
 
+# (fg_color, border_color) für Karten/Kategorie-Buttons
+CARD_STYLE = (BG_CARD, BORDER_CARD)
+CARD_STYLE_SELECTED = (BG_CARD_SELECTED, BORDER_CARD_SELECTED)
+
+
+# =============================================================================
+# Lazy Imports
+# =============================================================================
+
+def _import_pillow() -> None:
+    """Importiert Pillow erst, wenn das Logo tatsächlich geladen wird.
+
+    Nur Pillow wird aufgeschoben; tkinter/customtkinter werden weiterhin beim Modulimport geladen.
+    """
+    global Image
+    if Image is not None:
+        return
+    try:
+        from PIL import Image as _Image
+    except ImportError:
+        return
+    Image = _Image
+
 
 # =============================================================================
 # Paths (PyInstaller-safe)
@@ -92,25 +122,49 @@ WINGET_SETUP_PS = resource_path("winget-installscript.ps1")
 # Helper, um das PowerShell-Skript aufzurufen
 # =============================================================================
 
-def _run_silent(cmd: list[str], timeout: int = 5) -> subprocess.CompletedProcess:
+# Marker in der PS-Ausgabe (stehen hinter dem "INFO  - "/"OK    - "-Präfix)
+_MARK_START = "Installing app via winget:"
+_MARK_OK = "App installed successfully:"
+_MARK_FAILED = "FAILED_APPS:"
+
+_RE_VERSION = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
+@functools.lru_cache(maxsize=1)
+def _popen_kwargs() -> dict:
     """
-    Führt einen Prozess ohne sichtbares Fenster aus (Windows).
-    Gibt immer ein CompletedProcess zurück, stdout/stderr als Text.
+    Gemeinsame Popen-/run-Argumente für alle Child-Prozesse (Windows):
+    kein sichtbares Fenster, stdin auf DEVNULL (verhindert Hänger durch geerbte Handles).
     """
     startupinfo = subprocess.STARTUPINFO()
     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
     startupinfo.wShowWindow = subprocess.SW_HIDE
-
+    return {
+        "startupinfo": startupinfo,
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+        "stdin": subprocess.DEVNULL,
+    }
+
+
+def _run_silent(
+    cmd: list[str],
+    timeout: int = 5,
+    stderr_to_null: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    Führt einen Prozess ohne sichtbares Fenster aus (Windows).
+    Gibt immer ein CompletedProcess zurück, stdout/stderr als Text.
+    Mit stderr_to_null=True wird stderr verworfen (result.stderr ist dann None).
+    """
     return subprocess.run(
         cmd,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=subprocess.DEVNULL if stderr_to_null else subprocess.PIPE,
         text=True,
         encoding="utf-8",
         errors="replace",
         timeout=timeout,
-        startupinfo=startupinfo,
-        creationflags=subprocess.CREATE_NO_WINDOW,
+        **_popen_kwargs(),
     )
 
 
@@ -135,10 +189,6 @@ def run_winget_ps_setup() -> None:
         "-SetupWinget",
     ]
 
-    startupinfo = subprocess.STARTUPINFO()
-    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    startupinfo.wShowWindow = subprocess.SW_HIDE
-
     result = subprocess.run(
         cmd,
         stdout=subprocess.PIPE,
@@ -146,8 +196,7 @@ def run_winget_ps_setup() -> None:
         text=True,
         encoding="utf-8",
         errors="replace",
-        startupinfo=startupinfo,
-        creationflags=subprocess.CREATE_NO_WINDOW,
+        **_popen_kwargs(),
     )
 
     log_path = EXE_DIR / "winget-setup.log"
@@ -174,6 +223,8 @@ def run_winget_ps_setup() -> None:
 
 
 def run_winget_ps_install(app_ids: list[str], on_event=None) -> tuple[list[str], list[str]]:
+    # Doppelte IDs nur einmal installieren (Reihenfolge bleibt erhalten)
+    app_ids = list(dict.fromkeys(app_ids))
     if not app_ids:
         return ([], [])
 
@@ -186,59 +237,55 @@ def run_winget_ps_install(app_ids: list[str], on_event=None) -> tuple[list[str],
         "-NoProfile",
         "-ExecutionPolicy", "Bypass",
         "-File", str(WINGET_SETUP_PS),
-        *app_ids,  # <-- positional App-IDs
+        "-IdsFromStdin",  # App-IDs kommen per stdin (kein Kommandozeilen-Limit)
     ]
 
-    startupinfo = subprocess.STARTUPINFO()
-    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    startupinfo.wShowWindow = subprocess.SW_HIDE
-
+    popen_kw = dict(_popen_kwargs(), stdin=subprocess.PIPE)
     proc = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        startupinfo=startupinfo,
-        creationflags=subprocess.CREATE_NO_WINDOW,
+        # Binär lesen und pro Zeile selbst dekodieren (spart den TextIOWrapper)
+        bufsize=32768,  # größerer Puffer → weniger Read-Syscalls bei viel Output
+        **popen_kw,
     )
 
+    # App-IDs zeilenweise übergeben, dann stdin schließen (EOF für das Skript)
+    assert proc.stdin is not None
+    proc.stdin.write("\n".join(app_ids).encode("utf-8"))
+    proc.stdin.close()
+
     installed: list[str] = []
     failed: list[str] = []
     failed_ids_from_summary: list[str] = []
 
-    # Marker-Parser
-    re_start = re.compile(r"Installing app via winget:\s*(.+)$")
-    re_ok = re.compile(r"App installed successfully:\s*(.+)$")
-    re_failed = re.compile(r"FAILED_APPS:\s*(.+)$")
-
     # STDOUT live lesen
     assert proc.stdout is not None
-    for line in proc.stdout:
-        line = line.rstrip("\r\n")
+    for raw in proc.stdout:
+        line = raw.decode("utf-8", "replace").rstrip("\r\n")
 
         if on_event:
             on_event(("line", line))
 
-        m = re_start.search(line)
-        if m:
-            current_id = m.group(1).strip()
-            if on_event:
+        # Marker per str.partition statt Regex (reine Substring-Suche)
+        _, sep, tail = line.partition(_MARK_START)
+        if sep:
+            current_id = tail.strip()
+            if current_id and on_event:
                 on_event(("start", current_id))
             continue
 
-        m = re_ok.search(line)
-        if m:
-            ok_id = m.group(1).strip()
-            installed.append(ok_id)
-            if on_event:
-                on_event(("ok", ok_id))
+        _, sep, tail = line.partition(_MARK_OK)
+        if sep:
+            ok_id = tail.strip()
+            if ok_id:
+                installed.append(ok_id)
+                if on_event:
+                    on_event(("ok", ok_id))
             continue
 
-        m = re_failed.search(line)
-        if m:
-            tail = m.group(1).strip()
+        _, sep, tail = line.partition(_MARK_FAILED)
+        if sep:
             failed_ids_from_summary = [s.strip() for s in tail.split(",") if s.strip()]
             continue
 
@@ -246,7 +293,7 @@ def run_winget_ps_install(app_ids: list[str], on_event=None) -> tuple[list[str],
 
     stderr = ""
     if proc.stderr is not None:
-        stderr = proc.stderr.read() or ""
+        stderr = (proc.stderr.read() or b"").decode("utf-8", "replace")
 
     if failed_ids_from_summary:
         failed = failed_ids_from_summary
@@ -262,7 +309,7 @@ def run_winget_ps_install(app_ids: list[str], on_event=None) -> tuple[list[str],
 # Domain Model
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WingetPackage:
     id: str
     display_name: str
@@ -328,10 +375,25 @@ PACKAGES: Dict[str, WingetPackage] = {
     "whatsapp":    WingetPackage("9NKSQGP7F2NH", "WhatsApp Desktop", "WhatsApp für Windows.", "Kommunikation", False),
 }
 
+# Kategorien (inkl. "Alle") + Kategorie → Keys einmalig beim Import berechnen
+CATEGORIES: Tuple[str, ...] = ("Alle", *sorted({p.category for p in PACKAGES.values()}))
+BY_CATEGORY: Dict[str, Tuple[str, ...]] = {
+    "Alle": tuple(PACKAGES),
+    **{c: tuple(k for k, p in PACKAGES.items() if p.category == c) for c in CATEGORIES[1:]},
+}
+
+
+# PACKAGES ist zur Laufzeit unveränderlich → Sortierreihenfolge einmal vorberechnen
+_SORTED_KEYS: List[str] = sorted(PACKAGES, key=lambda k: PACKAGES[k].display_name.lower())
+_SORT_INDEX: Dict[str, int] = {k: i for i, k in enumerate(_SORTED_KEYS)}
+
+# Winget-ID → Anzeigename (Statuszeile / Fehlerliste bei der Installation)
+_ID_TO_NAME: Dict[str, str] = {p.id: p.display_name for p in PACKAGES.values()}
+
 
 def sorted_keys_for_render(keys: List[str]) -> List[str]:
     """Alphabetische Sortierung nach Anzeigename."""
-    return sorted(keys, key=lambda k: PACKAGES[k].display_name.lower())
+    return sorted(keys, key=_SORT_INDEX.__getitem__)
 
 
 class UiState(Enum):
@@ -341,6 +403,8 @@ class UiState(Enum):
     FAIL = "fail"
     SKIP = "skip"
 
+    style: Tuple[str, str]  # (Icon, Farbe), siehe UI_STATUS_STYLE
+
 
 UI_STATUS_STYLE: Dict[UiState, Tuple[str, str]] = {
     UiState.PENDING: ("•", TEXT_MUTED),
@@ -350,12 +414,18 @@ UI_STATUS_STYLE: Dict[UiState, Tuple[str, str]] = {
     UiState.SKIP:    ("⏭", "#6B7280"),
 }
 
+# Style direkt am Enum-Member ablegen → state.style statt Dict-Lookup
+for _state, _style in UI_STATUS_STYLE.items():
+    _state.style = _style
+
 
 class DepKey(Enum):
     WINGET = "winget"
     DESKTOP_APP_INSTALLER = "desktop_app_installer"
     POWERSHELL = "powershell"
 
+    label: str  # Anzeigetext, siehe DEP_LABELS
+
 
 DEP_LABELS: Dict[DepKey, str] = {
     DepKey.WINGET: "Winget verfügbar",
@@ -363,6 +433,9 @@ DEP_LABELS: Dict[DepKey, str] = {
     DepKey.POWERSHELL: "PowerShell verfügbar",
 }
 
+for _dep, _label in DEP_LABELS.items():
+    _dep.label = _label
+
 
 # =============================================================================
 # Dependency Checks (mit Versionsprüfung)
@@ -378,12 +451,13 @@ class WingetState(Enum):
 
 
 def _parse_version(text: str):
-    m = re.search(r"(\d+)\.(\d+)\.(\d+)", text)
+    m = _RE_VERSION.search(text)
     if not m:
         return None
-    return tuple(int(x) for x in m.groups())
+    return (int(m[1]), int(m[2]), int(m[3]))
 
 
+@functools.lru_cache(maxsize=1)
 def get_winget_state() -> tuple[WingetState, str | None]:
     try:
         result = _run_silent(["winget", "--version"], timeout=5)
@@ -407,6 +481,7 @@ def get_winget_state() -> tuple[WingetState, str | None]:
     return WingetState.OK, ver_str
 
 
+@functools.lru_cache(maxsize=1)
 def has_msstore_source() -> bool:
     try:
         result = _run_silent(["winget", "source", "list"], timeout=5)
@@ -415,6 +490,8 @@ def has_msstore_source() -> bool:
     except Exception:
         return False
 
+
+@functools.lru_cache(maxsize=1)
 def get_appinstaller_version() -> str | None:
     try:
         result = _run_silent(
@@ -439,6 +516,7 @@ def get_appinstaller_version() -> str | None:
     return txt or None
 
 
+@functools.lru_cache(maxsize=1)
 def is_powershell_available() -> bool:
     cmds = ["powershell", "pwsh"]
     for cmd in cmds:
@@ -446,6 +524,7 @@ def is_powershell_available() -> bool:
             result = _run_silent(
                 [cmd, "-NoLogo", "-NoProfile", "-Command", "Write-Output 'ok'"],
                 timeout=5,
+                stderr_to_null=True,
             )
             if result.returncode == 0 and "ok" in (result.stdout or ""):
                 return True
@@ -454,6 +533,64 @@ def is_powershell_available() -> bool:
     return False
 
 
+def invalidate_dependency_cache() -> None:
+    """Verwirft die gecachten Dependency-Checks (z.B. nach Winget-Setup/Upgrade)."""
+    for fn in (get_winget_state, has_msstore_source, get_appinstaller_version, is_powershell_available):
+        fn.cache_clear()
+
+
+def probe_dependencies() -> Dict[DepKey, object]:
+    """Führt die unabhängigen Dependency-Checks parallel aus.
+
+    Rückgabe:
+    - DepKey.WINGET                -> (WingetState, Version | None)
+    - DepKey.POWERSHELL            -> bool
+    - DepKey.DESKTOP_APP_INSTALLER -> App-Installer-Version | None
+    """
+    probes = {
+        DepKey.WINGET: get_winget_state,
+        DepKey.POWERSHELL: is_powershell_available,
+        DepKey.DESKTOP_APP_INSTALLER: get_appinstaller_version,
+    }
+    results: Dict[DepKey, object] = {}
+
+    def run(dep: DepKey, fn) -> None:
+        results[dep] = fn()
+
+    # Daemon-Threads statt Pool: ein laufender (rein lesender) Check hält das Beenden nicht auf
+    threads = [threading.Thread(target=run, args=(dep, fn), daemon=True) for dep, fn in probes.items()]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+# =============================================================================
+# Logo
+# =============================================================================
+
+_LOGO_CACHE: Dict[Tuple[int, int], ctk.CTkImage] = {}
+
+
+def _decode_logo(max_size: Tuple[int, int]):
+    """logo.png dekodieren und seitenverhältnistreu in max_size einpassen (gecacht über get_logo)."""
+    with Image.open(LOGO_PATH) as src:
+        img = src.copy()
+    img.thumbnail(max_size, Image.LANCZOS)
+    return img
+
+
+def get_logo(max_size: Tuple[int, int]) -> ctk.CTkImage:
+    """Liefert das Logo als CTkImage, gecacht pro Zielgröße (benötigt Pillow)."""
+    logo = _LOGO_CACHE.get(max_size)
+    if logo is None:
+        img = _decode_logo(max_size)
+        logo = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        _LOGO_CACHE[max_size] = logo
+    return logo
+
+
 # =============================================================================
 # PackageRow Widget
 # =============================================================================
@@ -461,6 +598,10 @@ def is_powershell_available() -> bool:
 class PackageRow(ctk.CTkFrame):
     """Kompakte Zeile: Checkbox | Name | Description."""
 
+    # Von allen Zeilen geteilt; wird vom Hauptfenster nach dem Tk-Root-Aufbau gesetzt
+    FONT_TITLE: ctk.CTkFont | None = None
+    FONT_DESC: ctk.CTkFont | None = None
+
     def __init__(
         self,
         master,
@@ -485,6 +626,8 @@ class PackageRow(ctk.CTkFrame):
         self.key = key
         self.var = var
         self.on_toggle = on_toggle
+        # zuletzt angewendeter Auswahl-Style (None = noch keiner)
+        self._applied_selected: bool | None = None
 
         self.configure(border_width=1, border_color=BORDER_CARD)
         self.grid_columnconfigure(1, weight=1)
@@ -503,7 +646,7 @@ class PackageRow(ctk.CTkFrame):
         self.title = ctk.CTkLabel(
             self,
             text=pkg.display_name,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.FONT_TITLE,
             anchor="w",
         )
         self.title.grid(row=0, column=1, sticky="nw", padx=(0, 10), pady=(8, 0))
@@ -512,7 +655,7 @@ class PackageRow(ctk.CTkFrame):
         self.sub = ctk.CTkLabel(
             self,
             text=pkg.description,
-            font=ctk.CTkFont(size=10),
+            font=self.FONT_DESC,
             text_color=TEXT_MUTED,
             anchor="nw",
             justify="left",
@@ -530,11 +673,15 @@ class PackageRow(ctk.CTkFrame):
         self._handle_toggle()
 
     def _handle_toggle(self):
-        self._update_style(self.var.get())
+        selected = self.var.get()
+        self._update_style(selected)
         if callable(self.on_toggle):
-            self.on_toggle()
+            self.on_toggle(selected)
 
     def _update_style(self, selected: bool):
+        if selected == self._applied_selected:
+            return
+        self._applied_selected = selected
         try:
             if selected:
                 self.configure(fg_color=BG_CARD_SELECTED, border_color=BORDER_CARD_SELECTED)
@@ -566,6 +713,13 @@ class WingetInstallerApp(ctk.CTk):
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
 
+        # CTkFont pro (Größe, Gewicht) nur einmal anlegen, siehe _font()
+        self._font_cache: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+        # Schriften einmal anlegen statt zwei CTkFont-Objekte pro PackageRow
+        PackageRow.FONT_TITLE = self._font(12, "bold")
+        PackageRow.FONT_DESC = self._font(10)
+
         self.title(APP_TITLE)
         self.geometry(WINDOW_SIZE)
         self.minsize(1120, 620)
@@ -585,25 +739,73 @@ class WingetInstallerApp(ctk.CTk):
         self.package_vars: Dict[str, tk.BooleanVar] = {
             k: tk.BooleanVar(value=False) for k in PACKAGES
         }
+        # Anzahl ausgewählter Pakete, inkrementell gepflegt (siehe _on_row_toggled)
+        self._selected_count = 0
+
+        # Suchtexte + Kategorie-Keys einmal vorberechnen (nicht pro Tastenanschlag)
+        self._haystacks: Dict[str, str] = {
+            k: f"{p.display_name} {p.description} {p.id} {p.category}".lower()
+            for k, p in PACKAGES.items()
+        }
+        # Reihenfolge hängt nur von der Kategorie ab (nicht von der Suche) → einmal sortieren
+        self._sorted_by_cat: Dict[str, List[str]] = {
+            c: sorted_keys_for_render(list(keys)) for c, keys in BY_CATEGORY.items()
+        }
 
         self.dep_labels: Dict[DepKey, ctk.CTkLabel] = {}
         self.rows: Dict[str, PackageRow] = {}
-        self.cat_buttons: List[ctk.CTkButton] = []
-
-        # Debounce-Handle für Resize-Events der Scroll-Canvas
-        self._list_resize_after_id: str | None = None
+        # aktuell sichtbare Rows: Key → Grid-Zeile (in Anzeige-Reihenfolge)
+        self.rows_visible: Dict[str, int] = {}
+        self.cat_buttons_by_name: Dict[str, ctk.CTkButton] = {}
+        self._current_cat = "Alle"
+
+        # Resize-Events der Scroll-Canvas: max. ein Flush pro Eventloop-Durchlauf
+        self._resize_dirty = False
+        # zuletzt auf alle Rows angewendete Breite (None = neu anwenden)
+        self._last_row_width: int | None = None
+        # Debounce-Handle für Eingaben im Suchfeld
+        self._search_after_id: str | None = None
+
+        # Fenster minimiert/versteckt → Render-/Resize-Arbeit bis zum nächsten <Map> aufschieben
+        self._visible = True
+        self._needs_render = False
+        self._needs_resize = False
+
+        # Gemeinsamer Hintergrund-Pool für Winget-Fix / Upgrade / Installation
+        # (Threads werden wiederverwendet statt pro Aktion neu gestartet). Anders als die früheren
+        # Daemon-Threads hält ein laufender Vorgang das Beenden auf → siehe _on_close.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="winget-bg")
+        self._close_requested = False
+
+        # Worker-Thread → Tk-Thread: Nachrichten sammeln, alle 50 ms abarbeiten
+        # ("progress", p) / ("status", fmt, *args) / ("done", ok, fail, total[, warnung]) / ("error", exc) / ("call", fn, args)
+        self._ui_queue: "queue.Queue[tuple]" = queue.Queue()
+        # Zeitpunkt des letzten Fortschritts-Updates (Drosselung, siehe UI_MIN_INTERVAL)
+        self._last_ui_push = 0.0
 
         self._set_window_icon()
         self._build_layout()
         self._bind_hotkeys()
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._schedule_ui_drain()
 
         # wichtig: HIER einmal initial rendern + danach Breite nochmal sauber ziehen
-        self.after(0, self._initial_render)
-        self.after(0, self._update_selected_count)
+        self.after_idle(self._initial_render)
+        self.after_idle(self._update_selected_count)
 
         # Dependencies separat prüfen
         self._check_dependencies_async()
 
+    def _font(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Geteilte CTkFont-Instanz pro (Größe, Gewicht)."""
+        key = (size, weight)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
     def _get_row_width(self) -> int:
         """Ermittelt die sinnvolle Breite für die App-Zeilen.
 
@@ -625,50 +827,87 @@ class WingetInstallerApp(ctk.CTk):
 
     def _on_list_canvas_configure(self, _event=None):
         """Wird bei Größenänderung der Scroll-Canvas getriggert.
-        Wir debouncen und passen dann die bestehenden Rows an.
+        Markiert die Rows als "dirty"; ein Burst von Events wird im nächsten
+        Idle-Durchlauf zu genau einem Resize zusammengefasst.
         """
-        if self._list_resize_after_id is not None:
-            try:
-                self.after_cancel(self._list_resize_after_id)
-            except Exception:
-                pass
-        self._list_resize_after_id = self.after(50, self._resize_rows_to_canvas)
+        if not self._resize_dirty:
+            self._resize_dirty = True
+            self.after_idle(self._flush_resize)
+
+    def _flush_resize(self):
+        self._resize_dirty = False
+        self._resize_rows_to_canvas()
+
+    def _on_map(self, event=None):
+        # <Map> feuert über das Toplevel-Bindtag auch für jedes Kind-Widget
+        if event is not None and event.widget is not self:
+            return
+        self._visible = True
+        if self._needs_render:
+            self._needs_render = False
+            self._render_package_list()
+        if self._needs_resize:
+            self._needs_resize = False
+            self._resize_rows_to_canvas()
+
+    def _on_unmap(self, event=None):
+        if event is not None and event.widget is not self:
+            return
+        self._visible = False
+
+    def _on_close(self):
+        """Fenster schließen: wartende Pool-Aufgaben verwerfen, dann beenden.
+
+        Läuft noch eine Installation / ein Upgrade / Winget-Fix, bleibt das Fenster sichtbar
+        und schließt sich erst danach – sonst liefe der Prozess unsichtbar weiter.
+        """
+        if self._installing:
+            if not messagebox.askyesno(
+                "Vorgang läuft",
+                "Es läuft noch ein winget-Vorgang.\n\n"
+                "Das Fenster nach dessen Abschluss automatisch schließen?",
+            ):
+                return
+            # Timer/Idle laufen während der Messagebox weiter → Vorgang kann inzwischen fertig sein
+            if self._installing:
+                self._close_requested = True
+                self.btn_cancel.configure(state="disabled")
+                self.title(f"{APP_TITLE} – wird nach Abschluss geschlossen …")
+                return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _close_if_requested(self):
+        """Am Ende eines Vorgangs: vorgemerktes Schließen ausführen."""
+        if self._close_requested:
+            self._on_close()
 
     def _resize_rows_to_canvas(self):
         """Passt bereits gerenderte Rows an die aktuelle Canvas-Breite an."""
-        self._list_resize_after_id = None
-
         if not self.rows:
             return
 
+        if not self._visible:
+            self._needs_resize = True
+            return
+
         new_w = self._get_row_width()
-        if not new_w:
+        if not new_w or new_w == self._last_row_width:
             return
 
         for r in self.rows.values():
             r.set_width(new_w)
+        self._last_row_width = new_w
 
     def _initial_render(self):
-        """Erstes Rendering + Workaround fürs Breiten-Glitch."""
+        """Erstes Rendering (genau ein Durchlauf)."""
 
-        # Layout / DPI vorberechnen lassen
+        # Layout / DPI vorberechnen lassen → _get_row_width liefert danach
+        # bereits die echte Canvas-Breite, die Rows passen auf Anhieb
         self.update_idletasks()
 
-        # einmal sauber rendern, indem wir das machen,
-        # was du sonst manuell tust: Kategorie kurz wechseln
-        cats = sorted({p.category for p in PACKAGES.values()})
-
-        if cats:
-            first_cat = cats[0]        # z.B. "Browser"
-            # kurz auf erste Kategorie…
-            self._set_category(first_cat)
-            # …und wieder zurück auf "Alle"
-            self._set_category("Alle")
-        else:
-            # Fallback, falls nur "Alle" existiert
-            self._set_category("Alle")
-
-        self._update_selected_count()
+        self._set_category("Alle")
 
         # Nach dem ersten Render nochmal Breite anhand der realen Canvas-Größe setzen
         self.after(80, self._resize_rows_to_canvas)
@@ -679,10 +918,71 @@ class WingetInstallerApp(ctk.CTk):
 
     def _open_url(self, url: str):
         try:
+            import webbrowser  # nur bei Klick benötigt
+
             webbrowser.open(url, new=2)
         except Exception as exc:
             messagebox.showinfo("Info", f"Link konnte nicht geöffnet werden:\n{exc}")
 
+    def _confirm_async(self, title: str, msg: str, on_yes):
+        """Ja/Nein-Dialog als CTkToplevel.
+
+        Anders als messagebox.askyesno blockiert er die Tk-Eventloop nicht;
+        bei "Ja" wird on_yes() aufgerufen.
+        """
+        dlg = ctk.CTkToplevel(self)
+        dlg.title(title)
+        dlg.resizable(False, False)
+        dlg.configure(fg_color=BG_WINDOW)
+        dlg.transient(self)
+
+        ctk.CTkLabel(dlg, text=msg, justify="left").grid(
+            row=0, column=0, columnspan=2, sticky="w", padx=20, pady=(18, 12)
+        )
+
+        def answer(yes: bool):
+            dlg.grab_release()
+            dlg.destroy()
+            if yes:
+                on_yes()
+
+        ctk.CTkButton(dlg, text="Ja", width=100, command=lambda: answer(True)).grid(
+            row=1, column=0, sticky="e", padx=(20, 6), pady=(0, 16)
+        )
+        ctk.CTkButton(
+            dlg,
+            text="Nein",
+            width=100,
+            fg_color=BG_CARD,
+            text_color="#111827",
+            hover_color="#E5E7EB",
+            border_width=1,
+            border_color="#D1D5DB",
+            command=lambda: answer(False),
+        ).grid(row=1, column=1, sticky="w", padx=(6, 20), pady=(0, 16))
+        dlg.protocol("WM_DELETE_WINDOW", lambda: answer(False))
+        # Tastatur wie bei askyesno: Enter = "Ja" (Standard), Escape = "Nein"
+        dlg.bind("<Return>", lambda e: answer(True))
+        dlg.bind("<KP_Enter>", lambda e: answer(True))
+        dlg.bind("<Escape>", lambda e: answer(False))
+
+        # mittig über dem Hauptfenster platzieren; Eingaben gehen nur an den Dialog
+        dlg.update_idletasks()
+        x = self.winfo_rootx() + (self.winfo_width() - dlg.winfo_width()) // 2
+        y = self.winfo_rooty() + (self.winfo_height() - dlg.winfo_height()) // 2
+        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+
+        def grab():
+            try:
+                dlg.grab_set()
+                dlg.focus_set()
+            except tk.TclError:
+                # CTkToplevel wird unter Windows verzögert eingeblendet → später erneut
+                if dlg.winfo_exists():
+                    dlg.after(50, grab)
+
+        grab()
+
     def _set_window_icon(self):
         if not ICON_PATH.exists():
             return
@@ -722,26 +1022,27 @@ class WingetInstallerApp(ctk.CTk):
         ctk.CTkLabel(
             left,
             text="Kategorien",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
         ).grid(row=0, column=0, sticky="w", padx=4, pady=(4, 6))
 
-        cats = ["Alle"] + sorted({p.category for p in PACKAGES.values()})
+        cats = CATEGORIES
 
         for i, cat in enumerate(cats, start=1):
+            fg, bd = CARD_STYLE_SELECTED if cat == "Alle" else CARD_STYLE
             btn = ctk.CTkButton(
                 left,
                 text=cat,
                 width=170,
                 height=34,
-                fg_color=BG_CARD if cat != "Alle" else BG_CARD_SELECTED,
+                fg_color=fg,
                 text_color="#111827",
                 hover_color="#E5E7EB",
                 border_width=1,
-                border_color=BORDER_CARD if cat != "Alle" else BORDER_CARD_SELECTED,
-                command=lambda c=cat: self._set_category(c),
+                border_color=bd,
+                command=functools.partial(self._set_category, cat),
             )
             btn.grid(row=i, column=0, sticky="ew", padx=4, pady=4)
-            self.cat_buttons.append(btn)
+            self.cat_buttons_by_name[cat] = btn
 
         # Middle
         mid = ctk.CTkFrame(content, fg_color=BG_WINDOW, width=MID_WIDTH)
@@ -753,7 +1054,7 @@ class WingetInstallerApp(ctk.CTk):
         ctk.CTkLabel(
             mid,
             text="Programme auswählen",
-            font=ctk.CTkFont(size=17, weight="bold"),
+            font=self._font(17, "bold"),
         ).grid(row=0, column=0, sticky="w", padx=4, pady=(4, 0))
 
         search_row = ctk.CTkFrame(mid, fg_color="transparent")
@@ -772,11 +1073,11 @@ class WingetInstallerApp(ctk.CTk):
             search_row,
             text="Ausgewählt: 0",
             text_color=TEXT_MUTED,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
         )
         self.selected_count_lbl.grid(row=0, column=1, sticky="e")
 
-        self.search_var.trace_add("write", lambda *_: self._render_package_list())
+        self.search_var.trace_add("write", self._on_search_changed)
 
         # Fester Wrapper (definiert die maximale Breite!)
         list_wrapper = ctk.CTkFrame(
@@ -830,7 +1131,7 @@ class WingetInstallerApp(ctk.CTk):
         ctk.CTkLabel(
             right,
             text="Voraussetzungen",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
         ).grid(row=1, column=0, sticky="w", padx=6, pady=(6, 2))
 
         self.dep_frame = ctk.CTkFrame(right, fg_color="transparent")
@@ -840,7 +1141,7 @@ class WingetInstallerApp(ctk.CTk):
         self.hint_lbl = ctk.CTkLabel(
             right,
             text="Hinweis:\nInstallation wird später\nüber PowerShell/Winget\nimplementiert.",
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             text_color=TEXT_MUTED,
             justify="left",
         )
@@ -875,7 +1176,7 @@ class WingetInstallerApp(ctk.CTk):
                 "Manuell installierte Software oder manche\n"
                 "Store-Apps bleiben unverändert."
             ),
-            font=ctk.CTkFont(size=9),
+            font=self._font(9),
             text_color=TEXT_MUTED,
             justify="left",
         )
@@ -902,7 +1203,7 @@ class WingetInstallerApp(ctk.CTk):
         self.footer_brand = ctk.CTkLabel(
             bottom,
             text=BRAND_TEXT,
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             text_color=TEXT_MUTED,
             cursor="hand2",
         )
@@ -926,31 +1227,20 @@ class WingetInstallerApp(ctk.CTk):
             hover_color="#E5E7EB",
             border_width=1,
             border_color="#D1D5DB",
-            command=self.destroy,
+            command=self._on_close,
         )
         self.btn_cancel.grid(row=1, column=4, padx=(6, 16), pady=(0, 8))
 
     def _load_logo(self):
-        if Image is None:
-            self.logo_label.configure(text="(Pillow fehlt)\n`pip install pillow`", text_color=TEXT_MUTED, justify="center")
-            return
         if not LOGO_PATH.exists():
             self.logo_label.configure(text="CLS-Logo\n(logo.png nicht gefunden)", text_color=TEXT_MUTED, justify="center")
             return
+        _import_pillow()
+        if Image is None:
+            self.logo_label.configure(text="(Pillow fehlt)\n`pip install pillow`", text_color=TEXT_MUTED, justify="center")
+            return
 
-        img = Image.open(LOGO_PATH)
-        max_width, max_height = 260, 120
-        img_ratio = img.width / img.height
-        box_ratio = max_width / max_height
-        if img_ratio > box_ratio:
-            new_w = max_width
-            new_h = int(max_width / img_ratio)
-        else:
-            new_h = max_height
-            new_w = int(max_height * img_ratio)
-
-        img = img.resize((new_w, new_h), Image.LANCZOS)
-        self._logo_img = ctk.CTkImage(light_image=img, dark_image=img, size=(new_w, new_h))
+        self._logo_img = get_logo((260, 120))
         self.logo_label.configure(image=self._logo_img, text="")
 
     # -------------------------------------------------------------------------
@@ -959,61 +1249,104 @@ class WingetInstallerApp(ctk.CTk):
 
     def _set_category(self, cat: str):
         self.category_var.set(cat)
-        for b in self.cat_buttons:
-            if b.cget("text") == cat:
-                b.configure(fg_color=BG_CARD_SELECTED, border_color=BORDER_CARD_SELECTED)
-            else:
-                b.configure(fg_color=BG_CARD, border_color=BORDER_CARD)
+        # nur den bisherigen und den neuen Button umstylen
+        if cat != self._current_cat:
+            prev = self.cat_buttons_by_name.get(self._current_cat)
+            if prev is not None:
+                prev.configure(fg_color=BG_CARD, border_color=BORDER_CARD)
+            btn = self.cat_buttons_by_name.get(cat)
+            if btn is not None:
+                btn.configure(fg_color=BG_CARD_SELECTED, border_color=BORDER_CARD_SELECTED)
+            self._current_cat = cat
+        self._render_package_list()
+
+    def _on_search_changed(self, *_):
+        """Suchfeld-Trace: schnelle Tastenanschläge zu einem Render-Durchlauf bündeln."""
+        if self._search_after_id is not None:
+            try:
+                self.after_cancel(self._search_after_id)
+            except Exception:
+                pass
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._do_filter)
+
+    def _do_filter(self):
+        self._search_after_id = None
         self._render_package_list()
 
     def _filtered_keys(self) -> List[str]:
         q = (self.search_var.get() or "").strip().lower()
         cat = self.category_var.get()
 
-        keys = list(PACKAGES.keys())
-
-        if cat and cat != "Alle":
-            keys = [k for k in keys if PACKAGES[k].category == cat]
+        base = self._sorted_by_cat.get(cat or "Alle", [])
 
+        # base ist bereits sortiert → Filtern erhält die Reihenfolge
         if q:
-            def match(k: str) -> bool:
-                p = PACKAGES[k]
-                hay = f"{p.display_name} {p.description} {p.id} {p.category}".lower()
-                return q in hay
-            keys = [k for k in keys if match(k)]
-
-        return sorted_keys_for_render(keys)
+            haystacks = self._haystacks
+            return [k for k in base if q in haystacks[k]]
+        return list(base)
 
     def _render_package_list(self):
-        # vorhandene Widgets entfernen
-        for child in self.list_scroll.winfo_children():
-            child.destroy()
-        self.rows.clear()
+        if not self._visible:
+            # beim nächsten <Map> einmal nachholen
+            self._needs_render = True
+            return
 
         keys = self._filtered_keys()
+        new_visible = {k: row for row, k in enumerate(keys)}
+
+        # unveränderte Liste → keine Grid-Arbeit (Layout selbst erledigt Tk gesammelt im Idle)
+        if new_visible != self.rows_visible:
+            # Rows werden wiederverwendet: nur weggefallene ausblenden statt zerstören
+            for k in self.rows_visible:
+                if k not in new_visible:
+                    self.rows[k].grid_remove()
+
+            # aktuelle Breite der Liste holen (nur für neu anzulegende Rows relevant)
+            row_width = self._get_row_width()
+
+            for k, row in new_visible.items():
+                r = self.rows.get(k)
+                if r is None:
+                    r = PackageRow(
+                        self.list_scroll,
+                        key=k,
+                        var=self.package_vars[k],
+                        on_toggle=self._on_row_toggled,
+                        width=row_width,
+                        height=ROW_HEIGHT,
+                    )
+                    self.rows[k] = r
+                    # neue Row → nächster Resize muss wieder alle Breiten prüfen
+                    self._last_row_width = None
+                # nur neu einblenden bzw. verschieben, wenn sich die Position geändert hat
+                if self.rows_visible.get(k) != row:
+                    r.grid(row=row, column=0, sticky="ew", padx=4, pady=4)
 
-        # aktuelle Breite der Liste holen
-        row_width = self._get_row_width()
-
-        row = 0
-        for k in keys:
-            r = PackageRow(
-                self.list_scroll,
-                key=k,
-                var=self.package_vars[k],
-                on_toggle=self._update_selected_count,
-                width=row_width,
-                height=ROW_HEIGHT,
-            )
-            r.grid(row=row, column=0, sticky="ew", padx=4, pady=4)
-            self.rows[k] = r
-            row += 1
+            self.rows_visible = new_visible
+
+        self._update_selected_count()
 
+    def _on_row_toggled(self, selected: bool):
+        self._selected_count += 1 if selected else -1
+        self._update_selected_count()
+
+    def _select_all(self, target: bool):
+        """Strg+A / Strg+D: ein Durchlauf, nur Zeilen mit geändertem Zustand neu zeichnen."""
+        changed = False
+        for key, v in self.package_vars.items():
+            if v.get() != target:
+                v.set(target)
+                changed = True
+                row = self.rows.get(key)
+                if row is not None:
+                    row.refresh()
+        if not changed:
+            return  # schon alles im Zielzustand → auch der Zähler bleibt gleich
+        self._selected_count = len(self.package_vars) if target else 0
         self._update_selected_count()
 
     def _update_selected_count(self):
-        cnt = sum(1 for v in self.package_vars.values() if v.get())
-        self.selected_count_lbl.configure(text=f"Ausgewählt: {cnt}")
+        self.selected_count_lbl.configure(text=f"Ausgewählt: {self._selected_count}")
 
     # -------------------------------------------------------------------------
     # Dependencies
@@ -1021,11 +1354,11 @@ class WingetInstallerApp(ctk.CTk):
 
     def _build_dep_labels(self):
         for row, dep in enumerate(DepKey):
-            icon, color = UI_STATUS_STYLE[UiState.PENDING]
+            icon, color = UiState.PENDING.style
             lbl = ctk.CTkLabel(
                 self.dep_frame,
-                text=f"{icon}  {DEP_LABELS[dep]}",
-                font=ctk.CTkFont(size=11),
+                text=f"{icon}  {dep.label}",
+                font=self._font(11),
                 text_color=color,
                 justify="left",
             )
@@ -1036,8 +1369,8 @@ class WingetInstallerApp(ctk.CTk):
         lbl = self.dep_labels.get(dep)
         if not lbl:
             return
-        icon, color = UI_STATUS_STYLE[state]
-        base_text = DEP_LABELS[dep]
+        icon, color = state.style
+        base_text = dep.label
 
         # Für App Installer / Store Backend auch die App-Installer-Version anzeigen, falls bekannt
         if dep == DepKey.DESKTOP_APP_INSTALLER:
@@ -1065,7 +1398,7 @@ class WingetInstallerApp(ctk.CTk):
         if version:
             text += f" (v{version})"
 
-        icon, color = UI_STATUS_STYLE[ui_state]
+        icon, color = ui_state.style
         lbl.configure(text=f"{icon}  {text}", text_color=color)
 
     def _set_fix_button_state(self, enabled: bool):
@@ -1078,47 +1411,51 @@ class WingetInstallerApp(ctk.CTk):
 
 
     def _check_dependencies_async(self):
+        # Daemon-Thread (nicht der Pool): wird das Fenster während des Checks geschlossen,
+        # endet der Prozess sofort statt bis zu den Probe-Timeouts (5–8 s) unsichtbar weiterzulaufen
         threading.Thread(target=self._check_dependencies_worker, daemon=True).start()
 
 
     def _check_dependencies_worker(self):
+        # Alle Checks parallel (jeder wartet nur auf einen Subprozess)
+        results = probe_dependencies()
+
         # 1) Winget-Status (CLI)
-        state, ver = get_winget_state()
+        state, ver = results[DepKey.WINGET]
         self._winget_state = state
         self._winget_version = ver
-        winget_ok = state == WingetState.OK
 
         # 2) PowerShell
-        ps_ok = is_powershell_available()
+        ps_ok = results[DepKey.POWERSHELL]
 
         # 3) App Installer (Store / Systemkomponente)
-        app_ver = get_appinstaller_version()
+        app_ver = results[DepKey.DESKTOP_APP_INSTALLER]
         self._appinstaller_version = app_ver
         app_ok = app_ver is not None
 
-        # UI-Updates ins Tk-Thread schieben
-        self.after(0, self._update_winget_label, state, ver)
-        self.after(
-            0,
-            self._set_dep_state,
-            DepKey.POWERSHELL,
-            UiState.OK if ps_ok else UiState.FAIL,
-        )
-
+        # Alle UI-Updates gesammelt in EINEM Callback ins Tk-Thread schieben
+        try:
+            self.after_idle(self._apply_dep_results, {
+                "winget_state": state,
+                "winget_ver": ver,
+                "ps_ok": ps_ok,
+                "app_ok": app_ok,
+                # Fix-Button, wenn Winget fehlt/veraltet ODER App Installer fehlt
+                "need_fix": (state != WingetState.OK) or (not app_ok),
+                "can_upgrade": state == WingetState.OK,
+            })
+        except (RuntimeError, tk.TclError):
+            pass  # Fenster wurde während des Checks geschlossen → nichts mehr anzuzeigen
+
+    def _apply_dep_results(self, r: dict):
+        """Wendet die Ergebnisse von _check_dependencies_worker im Tk-Thread an."""
+        self._update_winget_label(r["winget_state"], r["winget_ver"])
+        self._set_dep_state(DepKey.POWERSHELL, UiState.OK if r["ps_ok"] else UiState.FAIL)
         # App Installer / Store Backend
-        self.after(
-            0,
-            self._set_dep_state,
-            DepKey.DESKTOP_APP_INSTALLER,
-            UiState.OK if app_ok else UiState.FAIL,
-        )
-
-        # Fix-Button, wenn Winget fehlt/veraltet ODER App Installer fehlt
-        need_fix = (state != WingetState.OK) or (not app_ok)
-        self.after(0, self._set_fix_button_state, need_fix)
-
-        can_upgrade = state == WingetState.OK
-        self.after(0, self._set_upgrade_all_state, can_upgrade)
+        self._set_dep_state(DepKey.DESKTOP_APP_INSTALLER, UiState.OK if r["app_ok"] else UiState.FAIL)
+        self._set_fix_button_state(r["need_fix"])
+        self._set_upgrade_all_state(r["can_upgrade"])
+        self.update_idletasks()
 
 
     def _on_fix_winget(self):
@@ -1135,9 +1472,8 @@ class WingetInstallerApp(ctk.CTk):
             return
 
         # Buttons sperren
+        self._set_ui_busy(True)
         self.btn_fix_winget.configure(state="disabled")
-        self.btn_install.configure(state="disabled")
-        self.btn_readme.configure(state="disabled")
 
         # Visuelles Feedback
         self._set_dep_state(DepKey.WINGET, UiState.RUNNING)
@@ -1148,10 +1484,14 @@ class WingetInstallerApp(ctk.CTk):
         def worker():
             try:
                 # kleiner Fortschrittsbump
-                self.after(0, self.progress.set, 0.25)
+                self.after_idle(self.progress.set, 0.25)
 
                 # PowerShell-Setup ausführen
-                run_winget_ps_setup()
+                try:
+                    run_winget_ps_setup()
+                finally:
+                    # Winget/App Installer hat sich ggf. geändert → neu prüfen
+                    invalidate_dependency_cache()
 
                 # Wenn wir hier sind: Exitcode == 0 → Script OK durchgelaufen
                 def on_success():
@@ -1162,11 +1502,12 @@ class WingetInstallerApp(ctk.CTk):
                     # Dependencies / Versionsanzeige rechts neu einlesen
                     self._check_dependencies_async()
 
-                self.after(0, on_success)
+                self.after_idle(on_success)
 
             except Exception as exc:
                 # Fehler aus run_winget_ps_setup → Text + Popup
-                def on_error():
+                # (exc als Argument: der Name ist nach dem except-Block nicht mehr gebunden)
+                def on_error(err: Exception):
                     self.progress.set(1.0)
                     self.status_lbl.configure(
                         text="Fehler beim Winget / App Installer Setup."
@@ -1175,42 +1516,46 @@ class WingetInstallerApp(ctk.CTk):
                     self._set_dep_state(DepKey.DESKTOP_APP_INSTALLER, UiState.FAIL)
                     messagebox.showerror(
                         "Fehler",
-                        f"Fehler bei der Installation von Winget / App Installer:\n{exc}",
+                        f"Fehler bei der Installation von Winget / App Installer:\n{err}",
                     )
 
-                self.after(0, on_error)
+                self.after_idle(on_error, exc)
 
             finally:
                 def re_enable():
+                    self._set_ui_busy(False)
                     self.btn_fix_winget.configure(state="normal")
-                    self.btn_install.configure(state="normal")
-                    self.btn_readme.configure(state="normal")
+                    self._close_if_requested()
 
-                self.after(0, re_enable)
+                self.after_idle(re_enable)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._executor.submit(worker)
 
     def _on_upgrade_all(self):
         if self._installing:
             return
 
-        if not messagebox.askyesno(
+        self._confirm_async(
             "Programme aktualisieren",
             "Es werden alle Programme aktualisiert,\n"
             "die über winget verwaltet werden können.\n\n"
-            "Fortfahren?"
-        ):
+            "Fortfahren?",
+            self._start_upgrade_worker,
+        )
+
+    def _start_upgrade_worker(self):
+        if self._installing:
             return
 
-        self._installing = True
-        self.btn_install.configure(state="disabled")
+        self._set_ui_busy(True)
         self.btn_fix_winget.configure(state="disabled")
         self.btn_upgrade_all.configure(state="disabled")
-        self.btn_readme.configure(state="disabled")
         self.progress.set(0.0)
         self.status_lbl.configure(text="Aktualisiere Programme (winget) …")
 
         def worker():
+            # im Zweifel (Fehler, keine Summary) neu prüfen
+            env_changed = True
             try:
                 cmd = [
                     "powershell.exe",
@@ -1221,7 +1566,12 @@ class WingetInstallerApp(ctk.CTk):
                     "-UpgradeAll",
                 ]
 
-                stdout_lines: list[str] = []
+                # Summary wird direkt beim Lesen der PS-Ausgabe geparst (ein Durchlauf)
+                updated: list[tuple[str, str, str, str]] = []
+                not_updated: list[tuple[str, str, str, str]] = []
+                targets = {"UPDATED_APP": updated, "NOT_UPDATED_APP": not_updated}
+                inside = False
+                had_none = False
 
                 proc = subprocess.Popen(
                     cmd,
@@ -1230,7 +1580,8 @@ class WingetInstallerApp(ctk.CTk):
                     text=True,
                     encoding="utf-8",
                     errors="replace",
-                    creationflags=subprocess.CREATE_NO_WINDOW,
+                    bufsize=1,  # zeilengepuffert
+                    **_popen_kwargs(),
                 )
 
                 assert proc.stdout is not None
@@ -1239,46 +1590,32 @@ class WingetInstallerApp(ctk.CTk):
                     if not line:
                         continue
 
-                    stdout_lines.append(line)
-
-                    # Letzte Zeile im Status anzeigen
-                    self.after(
-                        0,
-                        lambda l=line: self.status_lbl.configure(text=l[:140]),
-                    )
-
-                rc = proc.wait()
-
-                # ---- Summary aus der PS-Ausgabe parsen ----
-                updated: list[tuple[str, str, str, str]] = []
-                not_updated: list[tuple[str, str, str, str]] = []
-                inside = False
-                had_none = False
+                    # Letzte Zeile im Status anzeigen (wird in _drain_ui_queue zusammengefasst)
+                    self._ui_queue.put(("status", line[:140]))
 
-                for line in stdout_lines:
-                    if line == "UPGRADE_SUMMARY_BEGIN":
-                        inside = True
+                    # ---- Summary-Marker ----
+                    if not inside:
+                        if line == "UPGRADE_SUMMARY_BEGIN":
+                            inside = True
                         continue
                     if line == "UPGRADE_SUMMARY_END":
                         inside = False
                         continue
-                    if not inside:
-                        continue
-
                     if line == "UPGRADE_NONE":
                         had_none = True
                         continue
 
-                    if line.startswith("UPDATED_APP: "):
-                        payload = line[len("UPDATED_APP: "):]
+                    marker, sep, payload = line.partition(": ")
+                    target = targets.get(marker) if sep else None
+                    if target is not None:
                         parts = [p.strip() for p in payload.split("|")]
                         name, appid, cur, avail = (parts + ["", "", "", ""])[:4]
-                        updated.append((name, appid, cur, avail))
-                    elif line.startswith("NOT_UPDATED_APP: "):
-                        payload = line[len("NOT_UPDATED_APP: "):]
-                        parts = [p.strip() for p in payload.split("|")]
-                        name, appid, cur, avail = (parts + ["", "", "", ""])[:4]
-                        not_updated.append((name, appid, cur, avail))
+                        target.append((name, appid, cur, avail))
+
+                rc = proc.wait()
+                # laut Summary nichts aktualisiert → gecachte Dependency-Ergebnisse bleiben gültig;
+                # ohne Summary (egal welcher ExitCode) lieber neu prüfen
+                env_changed = bool(updated) or not (had_none or not_updated)
 
                 def finish():
                     self.progress.set(1.0)
@@ -1319,51 +1656,48 @@ class WingetInstallerApp(ctk.CTk):
                     if total == 0:
                         return  # nichts zum Anzeigen
 
-                    lines: list[str] = []
+                    def bullets(entries: list[tuple[str, str, str, str]]) -> str:
+                        return "\n".join(
+                            f"• {n} ({a}) {c} → {v}" if c and v else f"• {n} ({a})"
+                            for n, a, c, v in entries
+                        )
 
+                    sections = []
                     if updated:
-                        lines.append("Aktualisierte Programme:\n")
-                        for name, appid, cur, avail in updated:
-                            if cur and avail:
-                                lines.append(f"• {name} ({appid}) {cur} → {avail}")
-                            else:
-                                lines.append(f"• {name} ({appid})")
-                        lines.append("")
-
+                        sections.append("Aktualisierte Programme:\n\n" + bullets(updated))
                     if not_updated:
-                        lines.append("Nicht aktualisiert / weiterhin als Update verfügbar:\n")
-                        for name, appid, cur, avail in not_updated:
-                            if cur and avail:
-                                lines.append(f"• {name} ({appid}) {cur} → {avail}")
-                            else:
-                                lines.append(f"• {name} ({appid})")
+                        sections.append(
+                            "Nicht aktualisiert / weiterhin als Update verfügbar:\n\n" + bullets(not_updated)
+                        )
 
                     messagebox.showinfo(
                         "Winget-Upgrade – Zusammenfassung",
-                        "\n".join(lines),
+                        "\n\n".join(sections),
                     )
 
-                self.after(0, finish)
+                # über die Queue, damit keine Zwischenzeile den Endstatus überschreibt
+                self._post(finish)
 
             except Exception as exc:
-                self.after(
-                    0,
-                    lambda: messagebox.showerror(
-                        "Fehler",
-                        f"Fehler beim Aktualisieren:\n{exc}",
-                    ),
+                self._post(
+                    messagebox.showerror,
+                    "Fehler",
+                    f"Fehler beim Aktualisieren:\n{exc}",
                 )
             finally:
                 def re_enable():
-                    self._installing = False
-                    self.btn_install.configure(state="normal")
-                    self.btn_readme.configure(state="normal")
-                    # Fix-/Upgrade-Button-Zustand neu prüfen
-                    self._check_dependencies_async()
+                    self._set_ui_busy(False)
+                    # Fix-/Upgrade-Button-Zustand neu setzen (Upgrade kann Winget selbst betreffen);
+                    # ohne Änderung kommen die Ergebnisse aus dem Cache, ohne neuen Subprozess
+                    if env_changed:
+                        invalidate_dependency_cache()
+                    # erst im Idle, damit die wieder freigegebenen Buttons sofort sichtbar sind
+                    self.after_idle(self._check_dependencies_async)
+                    self._close_if_requested()
 
-                self.after(0, re_enable)
+                self._post(re_enable)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._executor.submit(worker)
 
     # -------------------------------------------------------------------------
     # Install Flow
@@ -1378,135 +1712,198 @@ class WingetInstallerApp(ctk.CTk):
             messagebox.showinfo("Hinweis", "Bitte wähle mindestens ein Programm aus.")
             return
 
-        self._installing = True
-        self.btn_install.configure(state="disabled")
-        self.btn_readme.configure(state="disabled")
+        self._set_ui_busy(True)
         self.progress.set(0.0)
         self.status_lbl.configure(text="Installation wird vorbereitet …")
 
-        threading.Thread(target=self._install_worker, daemon=True).start()
+        fut = self._executor.submit(self._install_worker, selected)
+        fut.add_done_callback(self._on_install_done)
+
+    def _on_install_done(self, fut):
+        """Pool-Callback: Ausnahmen, die dem Worker entwischt sind, trotzdem melden."""
+        if not fut.cancelled() and fut.exception() is not None:
+            self._ui_queue.put(("error", fut.exception()))
+
+    def _set_ui_busy(self, busy: bool):
+        """Installation/Upgrade/Winget-Fix läuft bzw. ist beendet: Flag, Install-/Readme-Button, Hotkeys."""
+        self._installing = busy
+        state = "disabled" if busy else "normal"
+        self.btn_install.configure(state=state)
+        self.btn_readme.configure(state=state)
+        # während der Arbeit keine Hotkeys (kein Auswahlwechsel, kein zweiter Start)
+        if busy:
+            self._unbind_hotkeys()
+        else:
+            self._bind_hotkeys()
+
+    def _post(self, fn, *args):
+        """Thread-sicher: fn(*args) wird im Tk-Thread ausgeführt (siehe _drain_ui_queue)."""
+        self._ui_queue.put(("call", fn, args))
+
+    def _push_progress(self, prog: float, fmt: str, *args):
+        """Thread-sicher: Fortschritt + Statuszeile für den nächsten Drain ablegen.
+
+        Der Text wird erst im Tk-Thread formatiert – und nur, wenn er nicht schon
+        von einer neueren Meldung überholt wurde.
+        """
+        self._ui_queue.put(("progress", prog))
+        self._ui_queue.put(("status", fmt, *args))
+
+    def _drain_ui_queue(self):
+        """Arbeitet alle Worker-Nachrichten im Tk-Thread ab.
 
-    def _install_worker(self):
+        Von "progress"/"status" wird pro Durchlauf nur der letzte Wert angewendet;
+        alle anderen Nachrichten laufen in Reihenfolge (ausstehender Fortschritt zuerst).
+        """
+        prog = status = None
+        try:
+            while True:
+                try:
+                    msg = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                kind = msg[0]
+                if kind == "progress":
+                    prog = msg[1]
+                    continue
+                if kind == "status":
+                    status = msg
+                    continue
+
+                self._apply_progress(prog, status)
+                prog = status = None
+                if kind == "done":
+                    self._finish_success(*msg[1:])
+                elif kind == "error":
+                    self._finish_error(msg[1])
+                elif kind == "call":
+                    msg[1](*msg[2])
+            self._apply_progress(prog, status)
+        finally:
+            self._schedule_ui_drain()
+
+    def _schedule_ui_drain(self):
+        """Nächster Drain in 50 ms – erst im Idle, damit Eingaben Vorrang vor Redraws haben."""
+        self.after(50, self.after_idle, self._drain_ui_queue)
+
+    def _apply_progress(self, prog: float | None, status: tuple | None):
+        """Fortschrittsbalken + Statuszeile in einem Schritt setzen (None = unverändert)."""
+        if prog is not None:
+            self.progress.set(prog)
+        if status is not None:
+            _, fmt, *args = status
+            self.status_lbl.configure(text=fmt.format(*args) if args else fmt)
+
+    def _install_worker(self, selected_keys: List[str]):
+        # Auswahl kommt aus dem Tk-Thread (kein Zugriff auf Tk-Variablen im Worker)
         try:
-            selected_keys = [k for k, v in self.package_vars.items() if v.get()]
             if not selected_keys:
-                self.after(0, self._finish_success, 0, 0, 0)
+                self._ui_queue.put(("done", 0, 0, 0))
                 return
 
             app_ids = [PACKAGES[k].id for k in selected_keys]
             total = len(app_ids)
 
-            # Maps für schöne Namen im Status
-            id_to_name = {p.id: p.display_name for p in PACKAGES.values()}
-
-            state = {"done": 0}
+            done = 0
+            # Fortschritt = bereits fertig / total, einmal pro Installation vorberechnet
+            prog_table = tuple(i / total for i in range(total + 1))
 
             def on_event(ev):
+                nonlocal done
                 kind = ev[0]
 
                 if kind == "start":
                     cur_id = ev[1]
-                    cur_name = id_to_name.get(cur_id, cur_id)
-                    # Fortschritt = bereits fertig / total
-                    done = state["done"]
-                    prog = done / total if total else 0.0
-                    self.after(0, self.progress.set, prog)
-                    self.after(0, lambda: self.status_lbl.configure(
-                        text=f"[{done}/{total}] Installiere: {cur_name}"
-                    ))
+                    prog = prog_table[min(done, total)]
+                    self._last_ui_push = time.monotonic()
+                    self._push_progress(
+                        prog, "[{}/{}] Installiere: {}", done, total, _ID_TO_NAME.get(cur_id, cur_id)
+                    )
 
                 elif kind == "ok":
                     ok_id = ev[1]
-                    state["done"] += 1
-                    done = state["done"]
-                    prog = done / total if total else 1.0
-                    self.after(0, self.progress.set, prog)
-                    self.after(0, lambda: self.status_lbl.configure(
-                        text=f"{done}/{total} Programme installiert …"
-                    ))
+                    done += 1
+                    # Zwischenstände drosseln; das letzte "ok" wird immer angezeigt
+                    now = time.monotonic()
+                    if done < total and now - self._last_ui_push < UI_MIN_INTERVAL:
+                        return
+                    self._last_ui_push = now
+                    prog = prog_table[min(done, total)]
+                    self._push_progress(prog, "{}/{} Programme installiert …", done, total)
 
             # Startanzeige
-            self.after(0, self.progress.set, 0.0)
-            self.after(0, lambda: self.status_lbl.configure(text=f"Installiere {total} Programme …"))
+            self._push_progress(0.0, "Installiere {} Programme …", total)
 
             installed_ids, failed_ids = run_winget_ps_install(app_ids, on_event=on_event)
 
             ok = len(installed_ids)
             fail = len(failed_ids)
 
-            self.after(0, self.progress.set, 1.0)
-
-            # Fertig-Status + optional Warnung
+            # Fertig-Status + optional Warnung (ein UI-Schritt, siehe _finish_success)
             if fail > 0:
                 # hübsche Liste
-                pretty = []
-                for fid in failed_ids:
-                    pretty.append(f"• {id_to_name.get(fid, fid)}")
+                pretty = "\n".join(f"• {_ID_TO_NAME.get(fid, fid)}" for fid in failed_ids)
                 msg = (
                     "Einige Programme konnten nicht installiert werden:\n\n"
-                    + "\n".join(pretty)
+                    + pretty
                     + "\n\nAlle anderen Programme wurden installiert."
                 )
-                self.after(0, lambda: messagebox.showwarning("Teilweise fertig", msg))
-                self.after(0, self._finish_success, ok, fail, total)
+                self._ui_queue.put(("done", ok, fail, total, msg))
             else:
-                self.after(0, self._finish_success, ok, 0, total)
+                self._ui_queue.put(("done", ok, 0, total))
 
         except Exception as exc:
-            self.after(0, self._finish_error, exc)
+            self._ui_queue.put(("error", exc))
 
 
-    def _finish_success(self, ok: int = 0, fail: int = 0, total: int = 0):
-        self._installing = False
-        self.btn_install.configure(state="normal")
-        self.btn_readme.configure(state="normal")
+    def _finish_success(self, ok: int = 0, fail: int = 0, total: int = 0, warning: str | None = None):
+        self.progress.set(1.0)
+        self._set_ui_busy(False)
 
         if total == 0:
             self.status_lbl.configure(text="Fertig ✅")
-            return
-
-        if fail > 0:
+        elif fail > 0:
             self.status_lbl.configure(text=f"Fertig ⚠️  {ok}/{total} installiert, {fail} übersprungen")
         else:
             self.status_lbl.configure(text=f"Fertig ✅  {ok}/{total} installiert")
 
+        if warning:
+            messagebox.showwarning("Teilweise fertig", warning)
+        self._close_if_requested()
+
     def _finish_error(self, exc: Exception):
-        self._installing = False
-        self.btn_install.configure(state="normal")
-        self.btn_readme.configure(state="normal")
+        self._set_ui_busy(False)
         self.status_lbl.configure(text="Fehler bei der Installation.")
         messagebox.showerror("Fehler", f"Fehler bei der Installation:\n{exc}")
+        self._close_if_requested()
 
     # -------------------------------------------------------------------------
     # Hotkeys
     # -------------------------------------------------------------------------
 
-    def _bind_hotkeys(self):
-        self.bind_all("<KeyPress>", self._on_key_press)
-
-    def _on_key_press(self, event: tk.Event):
-        # CTRL+A → alles auswählen
-        if event.state & 0x4 and event.keysym.lower() == "a":
-            for key, v in self.package_vars.items():
-                v.set(True)
-            for row in self.rows.values():
-                row.refresh()
-            self._update_selected_count()
-            return
-
-        # CTRL+D → alles abwählen
-        if event.state & 0x4 and event.keysym.lower() == "d":
-            for key, v in self.package_vars.items():
-                v.set(False)
-            for row in self.rows.values():
-                row.refresh()
-            self._update_selected_count()
-            return
+    def _hotkeys(self):
+        """Tastenkürzel → Handler (Groß-/Kleinschreibung wegen Shift/Feststelltaste doppelt)."""
+        select_all = lambda e: self._select_all(True)      # CTRL+A → alles auswählen
+        deselect_all = lambda e: self._select_all(False)   # CTRL+D → alles abwählen
+        install = lambda e: self._on_install_clicked()     # ENTER → installieren
+        return (
+            ("<Control-a>", select_all),
+            ("<Control-A>", select_all),
+            ("<Control-d>", deselect_all),
+            ("<Control-D>", deselect_all),
+            ("<Return>", install),
+            ("<KP_Enter>", install),
+        )
 
-        # ENTER → installieren
-        if event.keysym in ("Return", "KP_Enter"):
-            self._on_install_clicked()
-            return
+    def _bind_hotkeys(self):
+        # nur im Hauptfenster (nicht in Dialogen wie dem Bestätigungsfenster);
+        # Modifier/Keysym prüft Tk selbst → normale Tastendrücke erreichen Python gar nicht
+        for seq, handler in self._hotkeys():
+            self.bind(seq, handler)
+
+    def _unbind_hotkeys(self):
+        for seq, _ in self._hotkeys():
+            self.unbind(seq)
 
 
 def main():